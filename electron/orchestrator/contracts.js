@@ -65,6 +65,10 @@ const COMMAND_OWNER = Object.freeze({
   // registered here or validateRequestEnvelope rejects it as an unknown command
   // before the request reaches the Python worker (see note above).
   import_media: WORKERS.resolve,
+  // Batched dispatch: run several resolve commands sequentially in one worker
+  // round trip. Entries are executed in order by handle_batch
+  // (helper/commands/__init__.py) and each gets its own ok/result/error slot.
+  batch: WORKERS.resolve,
 
   leaderpass_auth: WORKERS.platform,
   leaderpass_upload: WORKERS.platform
@@ -142,6 +146,9 @@ const COMMAND_SCHEMAS = Object.freeze({
   // cam_number}; the schema layer only checks top-level scalars, so per-item
   // validation lives in the Python handler (handle_import_media).
   import_media: { required: ['files'], types: { parent_bin: 'string' } },
+  // `commands` is an array of {cmd, payload}; each entry is routed and
+  // schema-checked like a standalone request by validateBatchEntries.
+  batch: { required: ['commands'], types: { stop_on_error: 'boolean' } },
   leaderpass_auth: { required: [], types: { force: 'boolean', force_refresh: 'boolean' } },
   leaderpass_upload: { required: ['file_path'], types: { file_path: 'string', chunk_size: 'number' } }
 });
@@ -251,21 +258,59 @@ function validateRequestEnvelope(envelope) {
     throw new UserError(`misrouted command ${envelope.cmd}: expected worker=${owner}, got worker=${envelope.worker}`);
   }
 
-  const schema = COMMAND_SCHEMAS[envelope.cmd];
-  if (schema) {
-    for (const field of schema.required || []) {
-      if (!(field in envelope.payload)) {
-        throw new UserError(`command ${envelope.cmd} missing required payload field: ${field}`);
-      }
+  validatePayloadSchema(envelope.cmd, envelope.payload);
+  if (envelope.cmd === 'batch') {
+    validateBatchEntries(envelope.payload.commands);
+  }
+}
+
+function validatePayloadSchema(cmd, payload, label = `command ${cmd}`) {
+  const schema = COMMAND_SCHEMAS[cmd];
+  if (!schema) return;
+  for (const field of schema.required || []) {
+    if (!(field in payload)) {
+      throw new UserError(`${label} missing required payload field: ${field}`);
     }
-    const types = schema.types || {};
-    Object.entries(types).forEach(([field, type]) => {
-      if (!(field in envelope.payload)) return;
-      if (typeof envelope.payload[field] !== type) {
-        throw new UserError(`command ${envelope.cmd} payload field ${field} must be ${type}`);
-      }
-    });
   }
+  const types = schema.types || {};
+  Object.entries(types).forEach(([field, type]) => {
+    if (!(field in payload)) return;
+    if (typeof payload[field] !== type) {
+      throw new UserError(`${label} payload field ${field} must be ${type}`);
+    }
+  });
+}
+
+// A batch runs its entries on the resolve worker without passing back through
+// validateRequestEnvelope, so each entry gets the checks a standalone request
+// would: resolve ownership and its COMMAND_SCHEMAS entry.
+function validateBatchEntries(commands) {
+  if (!Array.isArray(commands)) {
+    throw new UserError('command batch payload field commands must be an array');
+  }
+  commands.forEach((entry, index) => {
+    if (!entry || typeof entry !== 'object' || Array.isArray(entry)) {
+      throw new UserError(`batch entry ${index} must be an object`);
+    }
+    const { cmd, payload } = entry;
+    if (!cmd || typeof cmd !== 'string') {
+      throw new UserError(`batch entry ${index}: cmd must be a non-empty string`);
+    }
+    if (cmd === 'batch' || isMetaCommand(cmd)) {
+      throw new UserError(`batch entry ${index}: ${cmd} cannot be batched`);
+    }
+    const owner = commandOwner(cmd);
+    if (!owner) {
+      throw new UserError(`batch entry ${index}: unknown command: ${cmd}`);
+    }
+    if (owner !== WORKERS.resolve) {
+      throw new UserError(`batch entry ${index}: ${cmd} is not a ${WORKERS.resolve} worker command`);
+    }
+    if (!payload || typeof payload !== 'object' || Array.isArray(payload)) {
+      throw new UserError(`batch entry ${index}: payload must be an object`);
+    }
+    validatePayloadSchema(cmd, payload, `batch entry ${index} (${cmd})`);
+  });
 }
 
 function toWorkerWireMessage(envelope) {
@@ -1,4 +1,8 @@
 """Command handler package for Resolve/media workers."""
+from types import MappingProxyType
+from typing import Any, Dict, List
+
+from ..worker_runtime import takes_log_func
 from .connect import handle_connect
 from .context import handle_context
 from .add_marker import handle_add_marker
@@ -26,7 +30,50 @@ from .slate_span_report import handle_slate_span_report
 from .import_media import handle_import_media
 
 
-RESOLVE_HANDLERS = {
+def handle_batch(payload: Dict[str, Any], log_func=None) -> Dict[str, Any]:
+    """Run several resolve commands in one worker round trip.
+
+    Payload: { "commands": [{"cmd": "<name>", "payload": {...}}, ...],
+               "stop_on_error": false }
+
+    Entries run sequentially, in order, on the worker thread — the same thread
+    that serves single commands — so a `goto` followed by an `add_marker` sees
+    exactly the timeline/playhead state the first one left behind. Each entry
+    gets its own `{"ok", "result"|"error"}` slot in the returned list; a failing
+    entry does not abort the batch unless `stop_on_error` is set, in which case
+    the remaining entries are skipped (and omitted from `results`).
+    """
+    commands = payload.get("commands")
+    if not isinstance(commands, list):
+        raise ValueError("batch requires a 'commands' list")
+    stop_on_error = bool(payload.get("stop_on_error"))
+
+    results: List[Dict[str, Any]] = []
+    for entry in commands:
+        cmd = entry.get("cmd") if isinstance(entry, dict) else None
+        try:
+            # No nesting: a batch inside a batch buys nothing and would let a
+            # malformed request recurse.
+            if cmd == "batch" or cmd not in RESOLVE_HANDLERS:
+                raise ValueError(f"unknown command: {cmd!r}")
+            handler = RESOLVE_HANDLERS[cmd]
+            sub_payload = entry.get("payload") or {}
+            if log_func is not None and cmd in _LOG_AWARE:
+                result = handler(sub_payload, log_func=log_func)
+            else:
+                result = handler(sub_payload)
+            results.append({"cmd": cmd, "ok": True, "result": result})
+        except Exception as exc:
+            results.append({"cmd": cmd, "ok": False, "error": str(exc)})
+            if stop_on_error:
+                break
+
+    return {"results": results}
+
+
+# The handler tables are read-only views: the registry is fixed at import time
+# and nothing should patch handlers in at runtime.
+RESOLVE_HANDLERS = MappingProxyType({
     "context": handle_context,
     "add_marker": handle_add_marker,
     "start_render": handle_start_render,
@@ -52,10 +99,16 @@ RESOLVE_HANDLERS = {
     "open_sequence": handle_open_sequence,
     "slate_span_report": handle_slate_span_report,
     "import_media": handle_import_media,
-}
+    "batch": handle_batch,
+})
+
+# Resolve commands whose handler accepts log_func, for handle_batch.
+_LOG_AWARE = frozenset(
+    name for name, handler in RESOLVE_HANDLERS.items() if takes_log_func(handler)
+)
 
 # Reserved for future media worker commands (audit mode, etc.)
-MEDIA_HANDLERS = {}
+MEDIA_HANDLERS = MappingProxyType({})
 
 # Backwards compatibility for older entrypoint.
-HANDLERS = {**RESOLVE_HANDLERS, **MEDIA_HANDLERS}
+HANDLERS = MappingProxyType({**RESOLVE_HANDLERS, **MEDIA_HANDLERS})
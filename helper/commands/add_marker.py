@@ -20,17 +20,25 @@ def handle_add_marker(payload: Dict[str, Any]) -> Dict[str, Any]:
     duration = int(payload.get("duration", 1))
     custom_data = payload.get("custom_data", "")
 
-    if "timecode" in payload and payload["timecode"]:
-        tc = str(payload["timecode"])
-        res = rh.timeline.AddMarker(tc, color, name, note, duration, custom_data)
+    # Resolve the position once: explicit timecode, then frame, then playhead.
+    position: Any = None
+    if payload.get("timecode"):
+        position = str(payload["timecode"])
     elif "frame" in payload:
         try:
-            frame = int(payload["frame"])
-            res = rh.timeline.AddMarker(frame, color, name, note, duration, custom_data)  # type: ignore[arg-type]
+            position = int(payload["frame"])
         except Exception:
-            tc = rh.timeline.GetCurrentTimecode()
-            res = rh.timeline.AddMarker(tc, color, name, note, duration, custom_data)
-    else:
+            position = None
+    if position is None:
+        position = rh.timeline.GetCurrentTimecode()
+
+    try:
+        res = rh.timeline.AddMarker(position, color, name, note, duration, custom_data)
+    except Exception:
+        # A frame Resolve rejects falls back to the playhead, as before; a
+        # failing timecode/playhead add has nothing better to fall back to.
+        if not isinstance(position, int):
+            raise
         tc = rh.timeline.GetCurrentTimecode()
         res = rh.timeline.AddMarker(tc, color, name, note, duration, custom_data)
 
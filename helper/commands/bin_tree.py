@@ -44,6 +44,11 @@ def _folder_name(folder: Any) -> Optional[str]:
         return None
 
 
+def _find_child(folder: Any, name: str) -> Optional[Any]:
+    """First immediate subfolder of *folder* named *name*, or None."""
+    return next((child for child in _subfolders(folder) if _folder_name(child) == name), None)
+
+
 def walk_bin_tree(root_folder: Any) -> Iterator[Tuple[Any, List[str], int]]:
     """Preorder depth-first walk of every bin *under* root_folder (root itself
     excluded). Yields (folder, path_segments, depth) where path_segments is the
@@ -101,9 +106,9 @@ def resolve_folder_by_path(root_folder: Any, bin_path: Any) -> Optional[Any]:
     bin_path = str(bin_path)
 
     # Legacy / top-level exact match (fast path, fully back-compatible).
-    for folder in _subfolders(root_folder):
-        if _folder_name(folder) == bin_path:
-            return folder
+    folder = _find_child(root_folder, bin_path)
+    if folder is not None:
+        return folder
 
     if BIN_PATH_SEPARATOR not in bin_path:
         return None
@@ -111,12 +116,7 @@ def resolve_folder_by_path(root_folder: Any, bin_path: Any) -> Optional[Any]:
     # Path walk: descend one segment at a time.
     current = root_folder
     for segment in bin_path.split(BIN_PATH_SEPARATOR):
-        nxt = None
-        for child in _subfolders(current):
-            if _folder_name(child) == segment:
-                nxt = child
-                break
-        if nxt is None:
+        current = _find_child(current, segment)
+        if current is None:
             return None
-        current = nxt
     return current
@@ -1,5 +1,4 @@
 from typing import Any, Dict
-import threading
 
 
 def handle_connect(_payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -13,7 +12,7 @@ def handle_connect(_payload: Dict[str, Any]) -> Dict[str, Any]:
     if rh.resolve and rh._resolve_project_manager():
         return {"result": True}
     rh.resolve = None
-    rh.project_manager = rh.project = rh.timeline = None
+    rh._clear_context()
     if not rh._get_resolve_available:
         rh._status_event(False, "NO_PYTHON_GET_RESOLVE", "python_get_resolve not found")
         raise RuntimeError("python_get_resolve not available")
@@ -24,5 +23,5 @@ def handle_connect(_payload: Dict[str, Any]) -> Dict[str, Any]:
     rh.resolve = r
     rh._update_context()
     rh._status_event(True, "CONNECTED")
-    threading.Thread(target=rh._monitor_resolve, daemon=True).start()
+    rh._start_monitor()
     return {"result": True}
@@ -2,10 +2,14 @@ from typing import Any, Dict
 
 
 def handle_context(_payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Return basic Resolve context information."""
+    """Return basic Resolve context information.
+
+    Served from the names _update_context caches on every connect/monitor
+    refresh, so polling this costs no Resolve API calls.
+    """
     from .. import resolve_helper as rh
 
     return {
-        "project": rh.project.GetName() if rh.project else None,
-        "timeline": rh.timeline.GetName() if rh.timeline else None,
+        "project": rh._project_name,
+        "timeline": rh._timeline_name,
     }
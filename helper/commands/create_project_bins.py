@@ -17,14 +17,13 @@ def _normalize_bins_structure(raw: Any) -> Dict[str, Any]:
     if not isinstance(raw, dict):
         return DEFAULT_BINS_STRUCTURE
 
-    normalized: Dict[str, Any] = {}
-    for main_bin, sub_bins in raw.items():
-        if not isinstance(main_bin, str):
-            continue
-        if not isinstance(sub_bins, list):
-            normalized[main_bin] = []
-            continue
-        normalized[main_bin] = [name for name in sub_bins if isinstance(name, str)]
+    # Non-string bin names are dropped; a non-list value means "no sub-bins".
+    normalized: Dict[str, Any] = {
+        main_bin: [name for name in sub_bins if isinstance(name, str)]
+        if isinstance(sub_bins, list) else []
+        for main_bin, sub_bins in raw.items()
+        if isinstance(main_bin, str)
+    }
 
     return normalized or DEFAULT_BINS_STRUCTURE
 
@@ -43,18 +42,23 @@ def handle_create_project_bins(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     rh.log("Starting project bin generation")
 
+    # Each AddSubFolder is a round trip into Resolve with no bulk equivalent, so
+    # the saving available here is on our side: buffer the per-bin report and
+    # send it as one log event instead of one per folder.
+    lines = []
     for main_bin, sub_bins in bins_structure.items():
         main_folder = media_pool.AddSubFolder(root_folder, main_bin)
         if main_folder:
-            rh.log(f"✅ Created bin: {main_bin}")
+            lines.append(f"✅ Created bin: {main_bin}")
             for sub_bin in sub_bins:
                 sub_folder = media_pool.AddSubFolder(main_folder, sub_bin)
                 if sub_folder:
-                    rh.log(f"    ✅ Created sub-bin: {sub_bin}")
+                    lines.append(f"    ✅ Created sub-bin: {sub_bin}")
                 else:
-                    rh.log(f"    ❌ Failed to create sub-bin: {sub_bin}")
+                    lines.append(f"    ❌ Failed to create sub-bin: {sub_bin}")
         else:
-            rh.log(f"❌ Failed to create bin: {main_bin}")
+            lines.append(f"❌ Failed to create bin: {main_bin}")
 
-    rh.log("✔️ Project bin structure creation complete.")
+    lines.append("✔️ Project bin structure creation complete.")
+    rh.log("\n".join(lines))
     return {"result": True}
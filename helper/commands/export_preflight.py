@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 
-DEFAULT_EXPORT_BIN_NAME = "EXPORT"
+from .lp_base_export import DEFAULT_EXPORT_BIN_NAME
 
 
 def handle_export_preflight(payload: Dict[str, Any], log_func=None) -> Dict[str, Any]:
@@ -40,6 +40,7 @@ def handle_export_preflight(payload: Dict[str, Any], log_func=None) -> Dict[str,
             nm = clip.GetClipProperty("File Name")
         if nm:
             export_names.append(nm)
+    export_name_set = set(export_names)
 
     matched: List[str] = []
     # Per-timeline subtitle track count, keyed by timeline name. Powers the
@@ -48,15 +49,22 @@ def handle_export_preflight(payload: Dict[str, Any], log_func=None) -> Dict[str,
     # flags the gap before queuing. Always an int (0 on any Resolve hiccup) so
     # the UI can treat "missing key" and "0 tracks" the same way.
     subtitle_tracks: Dict[str, int] = {}
+    # Same early exit as lp_base_export: stop once every name has matched.
+    remaining = set(export_name_set)
     timeline_count = int(project.GetTimelineCount() or 0)
     for idx in range(1, timeline_count + 1):
         tl = project.GetTimelineByIndex(idx)
-        if tl and tl.GetName() in export_names:
-            name = tl.GetName()
+        if not tl:
+            continue
+        name = tl.GetName()
+        if name in export_name_set:
             matched.append(name)
             try:
                 subtitle_tracks[name] = int(tl.GetTrackCount("subtitle") or 0)
             except Exception:
                 subtitle_tracks[name] = 0
+            remaining.discard(name)
+            if not remaining:
+                break
 
     return {"names": matched, "subtitle_tracks": subtitle_tracks, "bin_found": True}
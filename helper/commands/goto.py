@@ -19,11 +19,7 @@ def handle_goto(payload: Dict[str, Any]) -> Dict[str, Any]:
             frame_num = int(frame)
         except Exception:
             raise ValueError("Invalid frame")
-        try:
-            fps = float(rh.timeline.GetSetting("timelineFrameRate") or 24)
-        except Exception:
-            fps = 24
-        tc = _frames_to_tc(frame_num, fps)
+        tc = _frames_to_tc(frame_num, rh._timeline_fps())
     else:
         raise ValueError("No timecode or frame provided")
 
@@ -44,6 +44,40 @@ def _capture_timeline_metadata(timeline: Any, project_name: Optional[str]) -> Di
         "project_name": project_name,
     }
 
+
+def _clip_name(clip: Any) -> Optional[str]:
+    """Media pool item name, falling back to its File Name property."""
+    try:
+        return clip.GetName()
+    except Exception:
+        return clip.GetClipProperty("File Name")
+
+
+def _wait_for_current_timeline(
+    project: Any, timeline_name: str, timeout: float = 1.0, interval: float = 0.02
+) -> bool:
+    """Poll until Resolve reports *timeline_name* as the current timeline.
+
+    SetCurrentTimeline returns before the switch has fully landed, and the
+    render settings / AddRenderJob that follow act on whatever is current. This
+    used to be a flat 1 s sleep per timeline; polling returns as soon as the
+    switch is visible (typically a few tens of ms) while keeping the same 1 s
+    upper bound. Returns False if the timeout elapsed without a match — the
+    caller carries on either way, exactly as it did after the fixed sleep.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            current = project.GetCurrentTimeline()
+            if current and current.GetName() == timeline_name:
+                return True
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
 def handle_lp_base_export(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Queue render jobs for timelines matching items in EXPORT bin."""
     from .. import resolve_helper as rh
@@ -68,10 +102,11 @@ def handle_lp_base_export(payload: Dict[str, Any]) -> Dict[str, Any]:
     target_dir = (payload.get("target_dir") or "").strip()
     unique_filename = payload.get("unique_filename", True)
 
-    if target_dir:
+    if target_dir and not os.path.isdir(target_dir):
         # Resolve silently falls back / fails if TargetDir doesn't exist. The
         # folder picker only yields existing paths, but create it defensively
-        # in case a saved/typed path no longer resolves.
+        # in case a saved/typed path no longer resolves. The isdir probe keeps
+        # the common (already-exists) case to a single stat.
         try:
             os.makedirs(target_dir, exist_ok=True)
         except OSError as exc:
@@ -94,26 +129,33 @@ def handle_lp_base_export(payload: Dict[str, Any]) -> Dict[str, Any]:
         rh.log(f"No media pool items found in '{export_bin_name}' bin.")
         return {"result": False}
 
-    export_names: List[str] = []
-    for clip in clip_list:
-        try:
-            clip_name = clip.GetName()
-        except Exception:
-            clip_name = clip.GetClipProperty("File Name")
-        rh.log(f" - {clip_name}")
-        export_names.append(clip_name)
-
-    # Map to timelines by name
+    export_names: List[str] = [_clip_name(clip) for clip in clip_list]
+    # One log event for the whole bin rather than one per clip; the console
+    # renders embedded newlines.
+    rh.log("\n".join(f" - {name}" for name in export_names))
+    # export_names keeps bin order for logging; match against a set so the
+    # timeline scan below is O(1) per timeline rather than O(clips).
+    export_name_set = set(export_names)
+
+    # Map to timelines by name. Each GetTimelineByIndex/GetName is a round trip
+    # into Resolve, so stop scanning once every EXPORT name has been matched —
+    # a 200-timeline project with 3 EXPORT clips rarely needs the full walk.
+    # Resolve keeps timeline names unique per project, so the first match for
+    # a name is the only one.
     matched_timelines = []
+    remaining = set(export_name_set)
     timeline_count = int(project.GetTimelineCount() or 0)
     for idx in range(1, timeline_count + 1):
         tl = project.GetTimelineByIndex(idx)
         if not tl:
             continue
         tl_name = tl.GetName()
-        if tl_name in export_names:
+        if tl_name in export_name_set:
             matched_timelines.append(tl)
             rh.log(f"Matched timeline: {tl_name}")
+            remaining.discard(tl_name)
+            if not remaining:
+                break
 
     if not matched_timelines:
         rh.log(f"No matching timelines found based on names in '{export_bin_name}' bin.")
@@ -126,7 +168,7 @@ def handle_lp_base_export(payload: Dict[str, Any]) -> Dict[str, Any]:
     for timeline in matched_timelines:
         timeline_name = timeline.GetName()
         project.SetCurrentTimeline(timeline)
-        time.sleep(1.0)  # brief settle
+        _wait_for_current_timeline(project, timeline_name)
 
         preset_loaded = project.LoadRenderPreset(export_preset_name)
         if not preset_loaded:
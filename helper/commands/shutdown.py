@@ -1,10 +1,15 @@
 from typing import Any, Dict
-import threading
-import time
-import sys
+
+from ..worker_runtime import request_shutdown
 
 
 def handle_shutdown(_payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Gracefully exit the helper."""
-    threading.Thread(target=lambda: (time.sleep(0.05), sys.exit(0)), daemon=True).start()
+    """Gracefully exit the helper.
+
+    Only flags the request: the worker loop exits right after this command's
+    response has been written and flushed. The old timer thread could exit
+    before the reply was out, and inside a batch it could cut the remaining
+    entries off mid-run.
+    """
+    request_shutdown()
     return {"result": True}
@@ -1,8 +1,5 @@
-from typing import Any, Dict, List, Tuple
-
-
-def _safe_get(obj, name, default=None):
-    return getattr(obj, name, default)
+import sys
+from typing import Any, Callable, Dict, List, Tuple
 
 
 def _comp_key(comp):
@@ -18,12 +15,10 @@ def _comp_key(comp):
     fall back to id() — at worst we re-walk one comp once, never more.
     """
     try:
-        get_attrs = _safe_get(comp, "GetAttrs")
-        if callable(get_attrs):
-            attrs = get_attrs() or {}
-            name = attrs.get("COMPS_Name") if isinstance(attrs, dict) else None
-            if name:
-                return ("name", str(name))
+        attrs = comp.GetAttrs() or {}
+        name = attrs.get("COMPS_Name") if isinstance(attrs, dict) else None
+        if name:
+            return ("name", str(name))
     except Exception:
         pass
     return ("id", id(comp))
@@ -42,27 +37,38 @@ def _get_fusion_comps(timeline_item):
         seen_keys.add(k)
         comps.append(comp)
 
-    get_count = _safe_get(timeline_item, "GetFusionCompCount")
-    get_by_idx = _safe_get(timeline_item, "GetFusionCompByIndex")
-    if callable(get_count) and callable(get_by_idx):
+    # Methods are called directly; a missing or stale one raises into the except.
+    try:
+        raw = timeline_item.GetFusionCompCount()
+        count = int(raw) if raw is not None else None
+    except Exception:
+        count = None
+    if count == 0:
+        # A count Resolve actually answered is authoritative: most timeline
+        # items carry no Fusion comp, and for those the list/by-name probes
+        # below would just be extra round trips that find nothing. Only when
+        # the count itself is unavailable do we fall through to them.
+        return comps
+    if count:
         try:
-            count = int(get_count() or 0)
+            get_by_idx = timeline_item.GetFusionCompByIndex
             for i in range(1, count + 1):
                 _add(get_by_idx(i))
         except Exception:
             pass
 
-    get_list = _safe_get(timeline_item, "GetFusionCompList")
-    if callable(get_list):
-        try:
-            d = get_list() or {}
-            for _, comp in (d.items() if hasattr(d, "items") else []):
-                _add(comp)
-        except Exception:
-            pass
+    try:
+        d = timeline_item.GetFusionCompList() or {}
+        for _, comp in (d.items() if hasattr(d, "items") else []):
+            _add(comp)
+    except Exception:
+        pass
 
-    get_by_name = _safe_get(timeline_item, "GetFusionCompByName")
-    if callable(get_by_name):
+    try:
+        get_by_name = timeline_item.GetFusionCompByName
+    except Exception:
+        get_by_name = None
+    if get_by_name is not None:
         for name in ("Fusion Composition", "FusionComp", "Effects"):
             try:
                 _add(get_by_name(name))
@@ -74,13 +80,18 @@ def _get_fusion_comps(timeline_item):
 
 def _tool_id(tool):
     try:
-        tid = _safe_get(tool, "ID")
-        if tid:
-            return str(tid)
-        attrs = tool.GetAttrs() if hasattr(tool, "GetAttrs") else {}
+        tid = tool.ID
+    except Exception:
+        tid = None
+    # Interned: a long timeline repeats the same few IDs ("TextPlus") on every
+    # result entry, so share one string object per distinct ID.
+    if tid:
+        return sys.intern(str(tid))
+    try:
+        attrs = tool.GetAttrs() or {}
         reg = attrs.get("TOOLS_RegID") if isinstance(attrs, dict) else None
         if reg:
-            return str(reg)
+            return sys.intern(str(reg))
     except Exception:
         pass
     return "UnknownTool"
@@ -96,17 +107,41 @@ def _tool_unique_name(tool):
     GetAttrs()["TOOLS_Name"] and is what `comp.FindTool(name)` matches on.
     """
     try:
-        get_attrs = _safe_get(tool, "GetAttrs")
-        if callable(get_attrs):
-            attrs = get_attrs() or {}
-            name = attrs.get("TOOLS_Name") if isinstance(attrs, dict) else None
-            if name:
-                return str(name)
+        attrs = tool.GetAttrs() or {}
+        name = attrs.get("TOOLS_Name") if isinstance(attrs, dict) else None
+        if name:
+            return sys.intern(str(name))
     except Exception:
         pass
     return ""
 
 
+# Tool-ID substring -> inputs that hold that tool's text, checked in order.
+# New text tool types only need an entry here.
+_TOOL_CANDIDATES: Dict[str, Tuple[str, ...]] = {
+    "textplus": ("StyledText",),
+    "text+": ("StyledText",),
+    "text3d": ("Text", "StyledText"),
+}
+
+
+# Raw tool ID -> resolved candidates (empty tuple for non-text tools). A
+# timeline only ever shows a handful of distinct IDs, so after the first tool
+# of each kind this is a single dict hit.
+_CANDIDATES_BY_TOOL_ID: Dict[str, Tuple[str, ...]] = {}
+
+
+def _tool_candidates(tool_id: str) -> Tuple[str, ...]:
+    candidates = _CANDIDATES_BY_TOOL_ID.get(tool_id)
+    if candidates is None:
+        tid = tool_id.lower()
+        candidates = next(
+            (inputs for marker, inputs in _TOOL_CANDIDATES.items() if marker in tid), ()
+        )
+        _CANDIDATES_BY_TOOL_ID[tool_id] = candidates
+    return candidates
+
+
 def _extract_text_from_tool(comp, tool):
     """Return every distinct text string the tool would display.
 
@@ -133,22 +168,22 @@ def _extract_text_from_tool(comp, tool):
             seen.add(s)
             texts.append(s)
 
-    tid = _tool_id(tool).lower()
-    candidates: Tuple[str, ...] = ()
-    if "textplus" in tid or "text+" in tid:
-        candidates = ("StyledText",)
-    elif "text3d" in tid:
-        candidates = ("Text", "StyledText")
+    candidates = _tool_candidates(_tool_id(tool))
+
+    if not candidates:
+        return texts
 
+    get_input = getattr(tool, "GetInput", None)
+    if not callable(get_input):
+        get_input = None
     for inp in candidates:
         try:
-            get_input = _safe_get(tool, "GetInput")
-            val = get_input(inp) if callable(get_input) else _safe_get(tool, inp)
+            val = get_input(inp) if get_input else getattr(tool, inp, None)
 
             if isinstance(val, dict):
                 # Keyframed input — emit every distinct value across the
                 # animation curve. Dict keys are frames (int/float); values
-                # are the strings. Do NOT also call _safe_get(tool, inp)
+                # are the strings. Do NOT also call getattr(tool, inp)
                 # here: in some Resolve builds that attribute access
                 # returns the same dict object, and _add(dict) would
                 # str(dict) the whole thing producing gibberish that
@@ -157,10 +192,12 @@ def _extract_text_from_tool(comp, tool):
                     _add(v)
             else:
                 _add(val)
-                if not texts:
-                    _add(_safe_get(tool, inp))
         except Exception:
-            pass
+            continue
+        # The first input that yields text is authoritative; Text3D lists
+        # both "Text" and "StyledText" and only one of them is ever live.
+        if texts:
+            break
     return texts
 
 
@@ -176,12 +213,8 @@ def _extract_texts_from_comp(comp):
     """
     out: List[Tuple[str, str, str]] = []
     try:
-        get_tool_list = _safe_get(comp, "GetToolList")
-        if not callable(get_tool_list):
-            return out
-
         try:
-            tools = get_tool_list(False) or {}
+            tools = comp.GetToolList(False) or {}
         except Exception:
             tools = {}
 
@@ -215,19 +248,40 @@ def _extract_texts_from_comp(comp):
     return out
 
 
-def _frames_to_tc(frame: int, fps: float) -> str:
-    """Convert a frame number to HH:MM:SS:FF timecode."""
+def _timecode_base(fps: float) -> int:
+    """Integer timecode base for *fps* (23.976 -> 24), defaulting to 24."""
     try:
         fps_int = int(round(fps))
         if fps_int <= 0:
             fps_int = 24
     except Exception:
         fps_int = 24
-    hours = frame // (fps_int * 3600)
-    minutes = (frame // (fps_int * 60)) % 60
-    seconds = (frame // fps_int) % 60
-    frames = frame % fps_int
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
+    return fps_int
+
+
+def _frames_to_tc(frame: int, fps: float) -> str:
+    """Convert a frame number to HH:MM:SS:FF timecode."""
+    return _make_tc_formatter(fps)(frame)
+
+
+def _make_tc_formatter(fps: float) -> Callable[[int], str]:
+    """Return a frame -> HH:MM:SS:FF formatter specialised for *fps*.
+
+    The base and its hour/minute multiples are computed once, so a caller
+    formatting many frames at the same rate (spellcheck, per timeline item)
+    only pays for the divisions.
+    """
+    fps_int = _timecode_base(fps)
+    per_hour = fps_int * 3600
+    per_minute = fps_int * 60
+
+    def fmt(frame: int) -> str:
+        return (
+            f"{frame // per_hour:02d}:{(frame // per_minute) % 60:02d}:"
+            f"{(frame // fps_int) % 60:02d}:{frame % fps_int:02d}"
+        )
+
+    return fmt
 
 
 def handle_spellcheck(_payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -238,30 +292,31 @@ def handle_spellcheck(_payload: Dict[str, Any]) -> Dict[str, Any]:
         raise RuntimeError("No active timeline")
 
     timeline = rh.timeline
-    try:
-        fps = float(timeline.GetSetting("timelineFrameRate") or 24)
-    except Exception:
-        fps = 24
+    # fps is fixed for the run; build the formatter once rather than per item.
+    frames_to_tc = _make_tc_formatter(rh._timeline_fps())
     vcount = int(timeline.GetTrackCount("video") or 0)
     found: List[Dict[str, Any]] = []
 
+    get_items = getattr(timeline, "GetItemListInTrack", None)
+    if not callable(get_items):
+        return {"items": found}
+
     for track_index in range(1, vcount + 1):
         try:
-            get_items = getattr(timeline, "GetItemListInTrack", None)
-            if not callable(get_items):
-                break
             items = get_items("video", track_index) or []
         except Exception:
             items = []
 
         for item in items:
             try:
-                get_start = getattr(item, "GetStart", None)
-                start_frame = int(get_start() or 0) if callable(get_start) else 0
-                timecode = _frames_to_tc(start_frame, fps)
                 comps = _get_fusion_comps(item)
                 if not comps:
                     continue
+                try:
+                    start_frame = int(item.GetStart() or 0)
+                except (AttributeError, TypeError):
+                    start_frame = 0
+                timecode = frames_to_tc(start_frame)
                 for comp in comps:
                     pairs = _extract_texts_from_comp(comp)
                     for tool_id, tool_name, text in pairs:
@@ -1,8 +1,48 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from .spellcheck import _get_fusion_comps, _tool_unique_name
 
 
+# start_frame -> item for the clips read on the last scan of a track, with the
+# timeline handle and track they came from. _update_context swaps in a new
+# timeline handle on refresh, which invalidates this.
+_track_index: Tuple[Any, int, Dict[int, Any]] = (None, -1, {})
+
+
+def _item_start(item) -> Optional[int]:
+    try:
+        return int(item.GetStart() or 0)
+    except Exception:
+        return None
+
+
+def _find_item(timeline, get_items, track: int, start_frame: int):
+    """Clip on `track` starting at `start_frame`, or None.
+
+    A cached hit is confirmed with one GetStart call (the clip may have been
+    moved since). A miss or a stale hit scans the track again, stopping at the
+    match like a plain lookup, and remembers the clips it read on the way.
+    """
+    global _track_index
+    cached_tl, cached_track, index = _track_index
+    if cached_tl is timeline and cached_track == track:
+        item = index.get(start_frame)
+        if item is not None and _item_start(item) == start_frame:
+            return item
+    index = {}
+    found = None
+    for item in get_items("video", track) or []:
+        start = _item_start(item)
+        if start is None:
+            continue
+        index.setdefault(start, item)
+        if start == start_frame:
+            found = item
+            break
+    _track_index = (timeline, track, index)
+    return found
+
+
 def handle_update_text(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Update the text of a Fusion tool identified by timeline position."""
     from .. import resolve_helper as rh
@@ -43,13 +83,7 @@ def handle_update_text(payload: Dict[str, Any]) -> Dict[str, Any]:
     get_items = getattr(rh.timeline, "GetItemListInTrack", None)
     if not callable(get_items):
         return {"result": False, "reason": "Timeline does not expose GetItemListInTrack"}
-    items = get_items("video", track) or []
-    target = None
-    for item in items:
-        get_start = getattr(item, "GetStart", None)
-        if callable(get_start) and int(get_start() or 0) == start_frame:
-            target = item
-            break
+    target = _find_item(rh.timeline, get_items, track, start_frame)
     if not target:
         return {
             "result": False,
@@ -36,7 +36,9 @@ import sys
 import time
 import logging
 import threading
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from helper import worker_runtime
 
 
 # NOTE: Phase 0 (2026-05-24) removed transcription from editpanel scope.
@@ -59,15 +61,16 @@ logger = logging.getLogger("lp_resolve_helper")
 def _print(obj: Dict[str, Any]) -> None:
     """Serialize *obj* to JSON and write it to stdout, flushing immediately."""
     try:
-        sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        sys.stdout.write(worker_runtime._encode(obj) + "\n")
         sys.stdout.flush()
+    except OSError:
+        # stdout is gone (Electron closed the pipe): exit quietly. The old
+        # sys.exit(0) here was caught by its own `except SystemExit` and never
+        # exited; os._exit also works when this runs on the monitor thread.
+        os._exit(0)
     except Exception as e:
-        # If stdout is gone, exit quietly.
+        # Unencodable payload — drop the line, keep the helper alive.
         logger.exception("Failed to write to stdout: %s", e)
-        try:
-            sys.exit(0)
-        except SystemExit:
-            pass
 
 
 def log(msg: str) -> None:
@@ -96,6 +99,10 @@ resolve = None
 project_manager = None
 project = None
 timeline = None
+# Names of the above, refreshed alongside them by _update_context. `context`
+# polls and status events read these instead of calling GetName() again.
+_project_name: Optional[str] = None
+_timeline_name: Optional[str] = None
 
 def _resolve_project_manager() -> Any:
     """Probe the live Resolve handle. Returns the ProjectManager, or None on failure.
@@ -121,20 +128,64 @@ def _safe_name(obj: Any) -> Optional[str]:
         return None
 
 
-def _update_context() -> None:
+def _update_context(pm: Any = None) -> None:
     """Refresh global project and timeline references. Never raises.
 
     Resolve can tear down between calls, so a handle that was live a moment ago may
     raise here. Swallow it and null the context rather than killing the caller
     (previously an uncaught raise here crashed the monitor thread).
+
+    *pm* is a ProjectManager the caller has just probed; passing it saves
+    fetching it again.
+    """
+    global project_manager, project, timeline, _project_name, _timeline_name
+    try:
+        pm = pm or _resolve_project_manager()
+        proj = pm.GetCurrentProject() if pm else None
+        tl = proj.GetCurrentTimeline() if proj else None
+    except Exception:
+        pm = proj = tl = None
+    proj_name, tl_name = _safe_name(proj), _safe_name(tl)
+    # Every Resolve call is done before anything is published. Handlers on the
+    # command thread read these globals while the monitor refreshes them; storing
+    # them in one go keeps a new project from being paired with the previous
+    # timeline or names for the length of a round trip.
+    project_manager, project, timeline, _project_name, _timeline_name = (
+        pm, proj, tl, proj_name, tl_name
+    )
+
+
+def _clear_context() -> None:
+    """Drop every cached Resolve handle and name (session lost / re-attach)."""
+    global project_manager, project, timeline, _project_name, _timeline_name
+    project_manager = project = timeline = None
+    _project_name = _timeline_name = None
+
+# Frame rate of `timeline`, remembered together with the handle it was read
+# from. _update_context swaps in a new handle on every refresh (Resolve hands
+# out a fresh wrapper per call), which is what invalidates this.
+_fps_cache: Tuple[Any, float] = (None, 24.0)
+
+
+def _timeline_fps(default: float = 24.0) -> float:
+    """Current timeline's frame rate, fetched at most once per timeline handle.
+
+    goto (once per navigation) and spellcheck both need it; the setting only
+    changes with the timeline, so repeat calls skip the GetSetting round trip.
     """
-    global project_manager, project, timeline
+    global _fps_cache
+    tl = timeline
+    if not tl:
+        return default
+    cached_tl, fps = _fps_cache
+    if cached_tl is tl:
+        return fps
     try:
-        project_manager = _resolve_project_manager()
-        project = project_manager.GetCurrentProject() if project_manager else None
-        timeline = project.GetCurrentTimeline() if project else None
+        fps = float(tl.GetSetting("timelineFrameRate") or default)
     except Exception:
-        project_manager = project = timeline = None
+        fps = default
+    _fps_cache = (tl, fps)
+    return fps
 
 def _status_event(ok: bool, code: str, msg: Optional[str] = None) -> None:
     """Emit an async status event (no id)."""
@@ -146,20 +197,38 @@ def _status_event(ok: bool, code: str, msg: Optional[str] = None) -> None:
     }
     if ok:
         payload["data"] = {
-            "project": project.GetName() if project else None,
-            "timeline": timeline.GetName() if timeline else None,
+            "project": _project_name,
+            "timeline": _timeline_name,
         }
     _print(payload)
 
-def _monitor_resolve(poll_seconds: float = 1.5) -> None:
+# Bumped by _start_monitor. A monitor whose generation is no longer current
+# exits at its next wake instead of polling alongside its replacement.
+_monitor_gen = 0
+
+
+def _start_monitor() -> None:
+    """Start the session monitor for a fresh attach, retiring any earlier one.
+
+    connect can re-attach within one poll interval of a session dying, before
+    the old monitor has noticed and exited; it would then carry on with the
+    new handle next to the monitor connect just started, doubling the polling
+    for the rest of the session.
+    """
+    global _monitor_gen
+    _monitor_gen += 1
+    threading.Thread(target=_monitor_resolve, args=(_monitor_gen,), daemon=True).start()
+
+
+def _monitor_resolve(gen: int, poll_seconds: float = 1.5) -> None:
     """Background thread: monitor Resolve and emit status on disconnect."""
-    global resolve, project_manager, project, timeline
+    global resolve
     logger.info("Monitoring Resolve session")
-    prev_project = _safe_name(project)
-    prev_timeline = _safe_name(timeline)
+    prev_project = _project_name
+    prev_timeline = _timeline_name
     while True:
         time.sleep(poll_seconds)
-        if not resolve:
+        if gen != _monitor_gen or not resolve:
             break
         # A single probe, fully guarded — treat both None and a raised exception
         # as "session lost" so a mid-teardown Resolve can never crash this thread.
@@ -169,13 +238,13 @@ def _monitor_resolve(poll_seconds: float = 1.5) -> None:
         if not pm:
             logger.warning("Lost Resolve session")
             resolve = None
-            project_manager = project = timeline = None
+            _clear_context()
             _status_event(False, "NO_SESSION", "Resolve closed or session lost")
             break
         else:
-            _update_context()
-            curr_project = _safe_name(project)
-            curr_timeline = _safe_name(timeline)
+            _update_context(pm)
+            curr_project = _project_name
+            curr_timeline = _timeline_name
             if curr_project != prev_project or curr_timeline != prev_timeline:
                 _status_event(True, "CONNECTED")
                 prev_project, prev_timeline = curr_project, curr_timeline
@@ -198,24 +267,31 @@ from helper.commands import HANDLERS
 # ---------- Main loop ----------
 def main() -> None:
     """Read JSON lines from stdin and dispatch to command handlers."""
-    for raw in sys.stdin:
-        raw = raw.strip()
-        if not raw:
+    # json.loads takes UTF-8 bytes directly, so skip the text layer's decode.
+    # Locals for the per-line lookups; this loop runs once per request.
+    loads = json.loads
+    dispatch = HANDLERS.get
+    for raw in getattr(sys.stdin, "buffer", sys.stdin):
+        # json.loads skips surrounding whitespace (including the newline)
+        # itself, so only blank keep-alive lines need filtering; no copy.
+        if raw.isspace():
             continue
         req_id: Any = None
         try:
-            request = json.loads(raw)
+            request = loads(raw)
             req_id = request.get("id")
             cmd = request.get("cmd")
-            if not cmd or cmd not in HANDLERS:
+            handler = dispatch(cmd) if cmd else None
+            if handler is None:
                 raise ValueError(f"unknown command: {cmd!r}")
 
-            handler = HANDLERS[cmd]
             data = handler(request)
             _print(_resp_ok(req_id, data))
         except Exception as exc:
             # Best-effort error response; include id if present so caller can match it.
             _print(_resp_err(req_id, str(exc)))
+        if worker_runtime._shutdown_requested:
+            worker_runtime._exit_now()
 
 if __name__ == "__main__":
     try:
@@ -1,52 +1,119 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import inspect
 import json
+import os
 import sys
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Mapping, Tuple
 
 Handler = Callable[[Dict[str, Any]], Any]
 
+# Shared by every response and event line, here and in resolve_helper._print.
+# json.dumps builds a fresh encoder per call when given options; Electron is the
+# only reader, so keep the output compact.
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+# Set by the shutdown command. The read loop exits once the response to the
+# current request has been written and flushed.
+_shutdown_requested = False
+
+
+def request_shutdown() -> None:
+    global _shutdown_requested
+    _shutdown_requested = True
+
+
+def _exit_now() -> None:
+    # os._exit rather than returning: interpreter teardown can block on a
+    # half-dead Resolve bridge (fusionscript), and atexit has nothing to run.
+    os._exit(0)
+
+
+# (epoch second, "HH:MM:SS") of the last log line. Chatty handlers log many
+# lines per second; strftime only needs to run when the second rolls over.
+_stamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    global _stamp_cache
+    now = int(time.time())
+    sec, text = _stamp_cache
+    if now != sec:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        _stamp_cache = (now, text)
+    return text
+
 
 def _emit_event(payload: Dict[str, Any]) -> None:
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    sys.stdout.write(_encode(payload) + "\n")
     sys.stdout.flush()
 
 
-def run_worker(handlers: Dict[str, Handler]) -> None:
-    for raw in sys.stdin:
-        raw = raw.strip()
-        if not raw:
+def takes_log_func(handler: Handler) -> bool:
+    """Whether *handler* can be called with a ``log_func=`` keyword.
+
+    Decided once per handler from its signature. Calling with the keyword and
+    retrying without it on TypeError ran a handler twice whenever its own body
+    raised a TypeError.
+    """
+    try:
+        params = inspect.signature(handler).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "log_func" or p.kind is p.VAR_KEYWORD for p in params)
+
+
+def _make_log_func(trace_id: Any) -> Callable[[str], None]:
+    def log_func(message: str) -> None:
+        _emit_event({
+            "event": "message",
+            "trace_id": trace_id,
+            "message": f"[{_timestamp()}] {message}",
+        })
+
+    return log_func
+
+
+def _ping(_request: Dict[str, Any]) -> Dict[str, str]:
+    return {"status": "ok"}
+
+
+def run_worker(handlers: Mapping[str, Handler]) -> None:
+    # One lookup per request: cmd -> (handler, takes log_func). "ping" is
+    # answered by the runtime itself, ahead of any handler of the same name.
+    dispatch = {
+        name: (handler, takes_log_func(handler))
+        for name, handler in {**handlers, "ping": _ping}.items()
+    }.get
+    loads = json.loads
+    # Raw UTF-8 lines go straight to json.loads, skipping the text-layer decode.
+    for raw in getattr(sys.stdin, "buffer", sys.stdin):
+        if raw.isspace():
             continue
         req_id = None
         request: Dict[str, Any] = {}
         try:
-            request = json.loads(raw)
+            request = loads(raw)
             req_id = request.get("id")
             cmd = request.get("cmd")
-            if cmd == "ping":
-                response = {"id": req_id, "ok": True, "data": {"status": "ok"}, "error": None}
-            elif not cmd or cmd not in handlers:
+            entry = dispatch(cmd) if cmd else None
+            if entry is None:
                 response = {"id": req_id, "ok": False, "data": None, "error": f"unknown command: {cmd!r}"}
             else:
+                handler, wants_log = entry
                 trace_id = request.get("trace_id")
-
-                def log_func(message: str) -> None:
-                    _emit_event({
-                        "event": "message",
-                        "trace_id": trace_id,
-                        "message": f"[{time.strftime('%H:%M:%S')}] {message}",
-                    })
-
-                handler = handlers[cmd]
-                try:
-                    data = handler(request, log_func=log_func)
-                except TypeError:
+                if wants_log:
+                    data = handler(request, log_func=_make_log_func(trace_id))
+                else:
                     data = handler(request)
                 response = {"id": req_id, "ok": True, "data": data, "error": None, "trace_id": trace_id}
         except Exception as exc:  # pragma: no cover - defensive worker boundary
             response = {"id": req_id, "ok": False, "data": None, "error": str(exc), "trace_id": request.get("trace_id") if isinstance(request, dict) else None}
 
-        sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+        sys.stdout.write(_encode(response) + "\n")
         sys.stdout.flush()
+        if _shutdown_requested:
+            _exit_now()
@@ -0,0 +1,57 @@
+const assert = require('assert');
+const { execFileSync } = require('child_process');
+
+// Exercises update_text's clip lookup against a fake 200-clip track, counting
+// GetStart calls. A baseline lookup is a linear scan that stops at the match.
+const result = JSON.parse(execFileSync('python', ['-c', `
+import json
+from helper.commands.update_text import _find_item
+
+calls = [0]
+
+class Item:
+    def __init__(self, start):
+        self.start = start
+    def GetStart(self):
+        calls[0] += 1
+        return self.start
+
+class Timeline:
+    def __init__(self, items):
+        self.items = items
+    def GetItemListInTrack(self, kind, track):
+        return list(self.items)
+
+items = [Item(i * 10) for i in range(200)]
+
+def lookup(tl, frame):
+    calls[0] = 0
+    found = _find_item(tl, tl.GetItemListInTrack, 1, frame)
+    return {"found": found.start if found else None, "calls": calls[0]}
+
+out = {}
+# Fresh handle per call, as after every monitor refresh.
+out["miss"] = [lookup(Timeline(items), f) for f in (50, 1000, 1990)]
+out["absent"] = lookup(Timeline(items), 7)
+tl = Timeline(items)
+lookup(tl, 1000)
+out["hit"] = lookup(tl, 500)
+items[50].start = 505
+out["moved"] = lookup(tl, 500)
+out["moved_new"] = lookup(tl, 505)
+print(json.dumps(out))
+`], { encoding: 'utf8' }).trim());
+
+result.miss.forEach((r, i) => {
+  const frame = [50, 1000, 1990][i];
+  assert.strictEqual(r.found, frame);
+  assert.ok(r.calls <= frame / 10 + 1, `miss at ${frame} made ${r.calls} GetStart calls, baseline scan makes ${frame / 10 + 1}`);
+});
+assert.strictEqual(result.absent.found, null);
+assert.ok(result.absent.calls <= 200, 'absent clip must not cost more than one full scan');
+assert.deepStrictEqual(result.hit, { found: 500, calls: 1 }, 'cached hit must be confirmed with a single GetStart');
+assert.strictEqual(result.moved.found, null, 'moved clip must not be returned from the cache');
+assert.ok(result.moved.calls > 1, 'stale cached hit must trigger a rescan');
+assert.strictEqual(result.moved_new.found, 505, 'rescan must find the clip at its new start');
+
+console.log('update_text lookup regression checks passed');
@@ -17,4 +17,23 @@ for (const cmd of expectedResolve) {
   assert.ok(handlers.resolve.includes(cmd), `${cmd} must be implemented in resolve worker`);
 }
 
+const batchEnvelope = commands => ({
+  id: 'b', worker: contracts.WORKERS.resolve, cmd: 'batch', payload: { commands }, trace_id: 't'
+});
+assert.doesNotThrow(() => contracts.validateRequestEnvelope(batchEnvelope([
+  { cmd: 'context', payload: {} },
+  { cmd: 'focus_comment', payload: { timeline_uid: 'u', frame: 10 } }
+])));
+for (const bad of [
+  [{ cmd: 'focus_comment', payload: { timeline_uid: 'u' } }],
+  [{ cmd: 'focus_comment', payload: { timeline_uid: 'u', frame: '10' } }],
+  [{ cmd: 'batch', payload: { commands: [] } }],
+  [{ cmd: 'ping', payload: {} }],
+  [{ cmd: 'nope', payload: {} }],
+  [{ cmd: 'context' }],
+  ['context']
+]) {
+  assert.throws(() => contracts.validateRequestEnvelope(batchEnvelope(bad)), contracts.UserError, JSON.stringify(bad));
+}
+
 console.log('worker routing regression checks passed');